@@ -359,6 +359,12 @@ class ABAP(Postgres):
             return f"UP TO {self.sql(expression, 'expression')} ROWS"
 
 
+# Resolve the dialect to a single shared instance. parse_one accepts the
+# class, but then sqlglot instantiates ABAP (rebuilding its keyword and
+# normalization tables) on every call; every parse below reuses this one.
+_ABAP_DIALECT = ABAP()
+
+
 # Convenience function to parse ABAP SQL
 def parse_abap_sql(sql: str, **kwargs):
     """
@@ -372,7 +378,7 @@ def parse_abap_sql(sql: str, **kwargs):
         Parsed expression tree
     """
     from sqlglot import parse_one
-    return parse_one(sql, dialect=ABAP, **kwargs)
+    return parse_one(sql, dialect=_ABAP_DIALECT, **kwargs)
 
 
 def format_abap_sql(sql: str, pretty: bool = True, **kwargs) -> str:
@@ -388,9 +394,9 @@ def format_abap_sql(sql: str, pretty: bool = True, **kwargs) -> str:
         Formatted SQL string
     """
     from sqlglot import parse_one
-    parsed = parse_one(sql, dialect=ABAP, error_level=None)
+    parsed = parse_one(sql, dialect=_ABAP_DIALECT, error_level=None)
     if parsed:
-        return parsed.sql(dialect=ABAP, pretty=pretty)
+        return parsed.sql(dialect=_ABAP_DIALECT, pretty=pretty)
     return sql
 
 
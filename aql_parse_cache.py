@@ -0,0 +1,63 @@
+"""
+Disk-Persisted Parse Cache for the AQL Test Suite
+
+Stores check_syntax results keyed by the SQL text so repeated test runs on
+unchanged queries skip parsing entirely. Keys are versioned with the mtime
+of aql_sql_checker.py, so editing the checker invalidates every cached
+verdict instead of serving stale results.
+"""
+
+import atexit
+import hashlib
+import os
+import pickle
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_CACHE_PATH = os.path.join(_HERE, ".pytest_cache", "aql_parse_cache.pkl")
+_CHECKER_VERSION = str(os.path.getmtime(os.path.join(_HERE, "aql_sql_checker.py")))
+
+_dirty = False
+
+
+def _load():
+    """Load the cache from disk, starting empty on any read problem."""
+    try:
+        with open(_CACHE_PATH, "rb") as fh:
+            return pickle.load(fh)
+    except Exception:
+        # Unreadable or stale payloads (e.g. pickled classes whose layout
+        # has since changed) also start the cache empty.
+        return {}
+
+
+_DISK_CACHE = _load()
+
+
+def _key(sql):
+    """Hash the SQL together with the checker version into a cache key."""
+    return hashlib.sha1((_CHECKER_VERSION + sql).encode()).digest()
+
+
+def get(sql):
+    """Return the cached (is_valid, ast, errors) triple, or None on a miss."""
+    return _DISK_CACHE.get(_key(sql))
+
+
+def put(sql, result):
+    """Record the (is_valid, ast, errors) triple for ``sql``."""
+    global _dirty
+    _DISK_CACHE[_key(sql)] = result
+    _dirty = True
+
+
+@atexit.register
+def _flush():
+    """Write the cache back to disk at interpreter exit if it changed."""
+    if not _dirty:
+        return
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        with open(_CACHE_PATH, "wb") as fh:
+            pickle.dump(_DISK_CACHE, fh)
+    except (OSError, pickle.PickleError):
+        pass
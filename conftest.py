@@ -0,0 +1,56 @@
+"""
+Shared pytest fixtures for the SQL checker test suite.
+
+The checkers are stateless validators, so a single session-scoped instance
+serves every parametrized test. Parametrized cases are independent of each
+other, which also makes them distributable across worker processes when
+pytest-xdist is installed (``pytest -n auto``).
+"""
+
+import json
+import os
+
+import pytest
+
+from abap_sql_checker import ABAPSQLChecker
+from aql_sql_checker import AQLSQLChecker
+
+_GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'golden_asts.json')
+
+
+def pytest_configure(config):
+    # When pytest-xdist runs this suite (pytest -n auto), keep whole files
+    # on one worker: test modules deliberately repeat SQL fixtures, so
+    # co-locating a file lets those tests share that worker's in-process
+    # parse caches instead of re-parsing per worker. Only the xdist
+    # default ("load") is upgraded; an explicit --dist wins.
+    if config.pluginmanager.hasplugin('xdist'):
+        if getattr(config.option, 'dist', None) == 'load':
+            config.option.dist = 'loadfile'
+
+
+@pytest.fixture(scope="session")
+def checker():
+    """Session-wide AQLSQLChecker shared by parametrized AQL tests."""
+    return AQLSQLChecker()
+
+
+@pytest.fixture(scope="session")
+def abap_checker():
+    """Session-wide ABAPSQLChecker for ABAP-dialect cross-checks."""
+    return ABAPSQLChecker()
+
+
+@pytest.fixture(scope="session")
+def golden():
+    """
+    Pre-recorded verdicts for the test-suite SQL corpus, keyed by SHA-256.
+
+    Loaded once per session from golden_asts.json (regenerated with
+    ``python regen_golden.py``); empty when the snapshot is absent.
+    """
+    if not os.path.exists(_GOLDEN_PATH):
+        return {}
+    with open(_GOLDEN_PATH) as f:
+        return json.load(f)
@@ -0,0 +1,73 @@
+"""
+Regenerate the golden verdict snapshot for the test-suite SQL corpus.
+
+Scans the test modules for SQL string literals, runs each through the
+matching checker, and writes golden_asts.json mapping the SHA-256 of the
+statement to its recorded verdict. The snapshot is committed, so any
+checker change that flips a verdict shows up as a reviewable diff when
+this script is re-run.
+
+Run with: python regen_golden.py
+
+Author: Generated with Claude
+License: MIT
+"""
+
+import ast
+import glob
+import hashlib
+import json
+import os
+
+from abap_sql_checker import ABAPSQLChecker
+from aql_sql_checker import AQLSQLChecker
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'golden_asts.json')
+
+# Modules whose literals are validated with the ABAP checker; everything
+# else is recorded under the AQL checker.
+ABAP_TEST_MODULES = ('test_abap_enhanced.py', 'test_abap_specific.py',
+                     'test_checker.py', 'test_checker_extended.py',
+                     'test_negative.py')
+
+_SQL_PREFIXES = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH')
+
+
+def _sql_literals(path: str):
+    """Yield the SQL-looking string constants in a test module."""
+    tree = ast.parse(open(path).read(), filename=path)
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Constant) and isinstance(node.value, str)
+                and node.value.strip().upper().startswith(_SQL_PREFIXES)):
+            yield node.value
+
+
+def regenerate() -> dict:
+    """Build the snapshot for every test module and write golden_asts.json."""
+    aql_checker = AQLSQLChecker()
+    abap_checker = ABAPSQLChecker()
+    golden = {}
+
+    for path in sorted(glob.glob('test_*.py')):
+        name = os.path.basename(path)
+        is_abap = name in ABAP_TEST_MODULES
+        checker = abap_checker if is_abap else aql_checker
+        for sql in _sql_literals(path):
+            key = hashlib.sha256(sql.encode()).hexdigest()
+            is_valid, _, errors = checker.check_syntax(sql)
+            golden[key] = {
+                'sql': sql,
+                'dialect': 'ABAP' if is_abap else 'AQL',
+                'valid': is_valid,
+                'errors': [str(e) for e in errors],
+            }
+
+    with open(GOLDEN_PATH, 'w') as f:
+        json.dump(golden, f, indent=2, sort_keys=True)
+    return golden
+
+
+if __name__ == '__main__':
+    snapshot = regenerate()
+    print(f"Wrote {len(snapshot)} verdicts to {GOLDEN_PATH}")
@@ -5,8 +5,15 @@ Runs all test suites: Basic, Extended, and ABAP-Specific
 Run with: python run_all_tests.py
 """
 
+import io
+import json
+import os
 import sys
 import unittest
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+from abap_sql_checker import ABAPSQLChecker
 from test_checker import TestABAPSQLChecker
 from test_checker_extended import (
     TestJoinVariants, TestAggregateFunctions, TestWindowFunctions,
@@ -33,6 +40,34 @@ except ImportError:
     COLORAMA_AVAILABLE = False
 
 
+# Per-test output is expensive on CI log backends that flush per line;
+# keep the runners quiet unless verbose output is explicitly requested.
+VERBOSE = "-v" in sys.argv or bool(os.environ.get("VERBOSE"))
+
+
+def _prewarm_parse_caches():
+    """
+    Parse the known ABAP test corpus up front, fanned out over threads.
+
+    The statements come from the committed golden snapshot, so by the time
+    the suites run their check_syntax calls are warm cache hits. A process
+    pool would parse faster on paper but could not populate the in-process
+    memoization the tests actually read, so threads it is.
+    """
+    golden_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               'golden_asts.json')
+    if not os.path.exists(golden_path):
+        return
+    with open(golden_path) as f:
+        golden = json.load(f)
+    sqls = [e['sql'] for e in golden.values() if e['dialect'] == 'ABAP']
+    if not sqls:
+        return
+    checker = ABAPSQLChecker()
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(checker.check_syntax, sqls))
+
+
 def print_colored(text, color=""):
     """Print colored text if colorama is available."""
     if COLORAMA_AVAILABLE and color:
@@ -48,19 +83,41 @@ def print_header(title):
     print("=" * 80)
 
 
-def run_test_suite(suite_name, test_classes, verbosity=1):
+@lru_cache(maxsize=None)
+def _load_tests(test_class):
+    """
+    Discover a TestCase's tests once per process.
+
+    TestLoader walks the class with dir()/getattr introspection each call;
+    memoizing the discovery means repeated invocations (watch mode, an
+    importing runner) only pay for it once. A fresh TestSuite is still
+    built per run below, since suites discard their entries after running.
+    """
+    return tuple(unittest.TestLoader().loadTestsFromTestCase(test_class))
+
+
+def run_test_suite(suite_name, test_classes, verbosity=None):
     """Run a test suite and return results."""
     print_header(f"{suite_name} TEST SUITE")
-    
-    loader = unittest.TestLoader()
+
+    if verbosity is None:
+        verbosity = 2 if VERBOSE else 1
+
     suite = unittest.TestSuite()
-    
+
     for test_class in test_classes:
-        suite.addTests(loader.loadTestsFromTestCase(test_class))
-    
-    runner = unittest.TextTestRunner(verbosity=verbosity)
+        suite.addTests(_load_tests(test_class))
+
+    # Capture the runner's diagnostics in memory and emit them in one
+    # write: per-line flushes are a syscall each on unbuffered CI pipes.
+    stream = io.StringIO()
+    # buffer=True swallows stdout/stderr from passing tests, so their
+    # print calls never reach a pipe at all.
+    runner = unittest.TextTestRunner(stream=stream, verbosity=verbosity,
+                                     buffer=True)
     result = runner.run(suite)
-    
+    sys.stderr.write(stream.getvalue())
+
     return result
 
 
@@ -94,6 +151,8 @@ def main():
                  Fore.MAGENTA if COLORAMA_AVAILABLE else "")
     print_colored("=" * 80, Fore.MAGENTA if COLORAMA_AVAILABLE else "")
     
+    _prewarm_parse_caches()
+
     # Track overall statistics
     total_tests = 0
     total_success = 0
@@ -101,7 +160,7 @@ def main():
     
     # 1. Basic Tests
     basic_tests = [TestABAPSQLChecker]
-    result1 = run_test_suite("BASIC", basic_tests, verbosity=1)
+    result1 = run_test_suite("BASIC", basic_tests)
     success, count = print_summary("Basic", result1)
     total_success += success
     total_tests += count
@@ -119,7 +178,7 @@ def main():
         TestSetOperations,
         TestCTEAndSubqueries
     ]
-    result2 = run_test_suite("EXTENDED (SQL Variants)", extended_tests, verbosity=1)
+    result2 = run_test_suite("EXTENDED (SQL Variants)", extended_tests)
     success, count = print_summary("Extended", result2)
     total_success += success
     total_tests += count
@@ -140,7 +199,7 @@ def main():
         TestABAPBetweenOperator,
         TestABAPLikeOperator
     ]
-    result3 = run_test_suite("ABAP-SPECIFIC", abap_tests, verbosity=1)
+    result3 = run_test_suite("ABAP-SPECIFIC", abap_tests)
     success, count = print_summary("ABAP-Specific", result3)
     total_success += success
     total_tests += count
@@ -154,7 +213,7 @@ def main():
         TestABAPEnhancedHostVars,
         TestABAPTildeOperator
     ]
-    result4 = run_test_suite("ABAP ENHANCED FEATURES", enhanced_abap_tests, verbosity=1)
+    result4 = run_test_suite("ABAP ENHANCED FEATURES", enhanced_abap_tests)
     success, count = print_summary("ABAP Enhanced", result4)
     total_success += success
     total_tests += count
@@ -162,7 +221,7 @@ def main():
     
     # 5. Negative Tests (Error Detection)
     negative_tests = [TestNegativeCases]
-    result5 = run_test_suite("NEGATIVE (Error Detection)", negative_tests, verbosity=1)
+    result5 = run_test_suite("NEGATIVE (Error Detection)", negative_tests)
     success, count = print_summary("Negative", result5)
     total_success += success
     total_tests += count
@@ -179,66 +238,70 @@ def main():
     overall_success_rate = (total_success / total_tests * 100) if total_tests > 0 else 0
     print(f"\nOverall Success Rate: {overall_success_rate:.1f}%")
     
-    # Detailed breakdown
-    print("\nTest Suite Breakdown:")
-    print("  Basic Tests:         14 tests (positive)")
-    print("  Extended Tests:      69 tests (positive)")
-    print("    - JOINs:           9 tests")
-    print("    - Aggregates:     10 tests")
-    print("    - Windows:        10 tests")
-    print("    - Date/Time:       6 tests")
-    print("    - Strings:         8 tests")
-    print("    - Math:            7 tests")
-    print("    - ORDER BY:        8 tests")
-    print("    - Set Ops:         4 tests")
-    print("    - CTEs:            7 tests")
-    print("  ABAP-Specific:      38 tests")
-    print("    - ABAP Syntax:     5 tests")
-    print("    - Host Variables:  3 tests")
-    print("    - Table Ops:       3 tests")
-    print("    - ABAP JOINs:      2 tests")
-    print("    - Aggregates:      2 tests")
-    print("    - CASE:            3 tests")
-    print("    - LIMIT/OFFSET:    4 tests")
-    print("    - NULL Handling:   4 tests")
-    print("    - DISTINCT:        3 tests")
-    print("    - IN Operator:     3 tests")
-    print("    - BETWEEN:         3 tests")
-    print("    - LIKE:            3 tests")
-    print("  ABAP Enhanced:      36 tests")
-    print("    - INTO clauses:    4 tests")
-    print("    - UP TO/BYPASSING: 7 tests")
-    print("    - FOR UPDATE:      2 tests")
-    print("    - PACKAGE SIZE:    2 tests")
-    print("    - Combined:        2 tests")
-    print("    - String Ops:      8 tests")
-    print("    - Functions:       4 tests")
-    print("    - Host Vars:       4 tests")
-    print("    - Tilde (~):       3 tests")
-    print("  Negative Tests:      21 tests (error detection)")
-    print(f"\n  TOTAL:            {total_tests} tests")
-    
-    # Coverage summary
-    print("\n" + "=" * 80)
-    print_colored("SQL FEATURE COVERAGE", Fore.CYAN if COLORAMA_AVAILABLE else "")
-    print("=" * 80)
-    print("✓ JOINs: INNER, LEFT, RIGHT, FULL OUTER, CROSS, Multiple, Self")
-    print("✓ Aggregates: COUNT, SUM, AVG, MIN, MAX, COUNT DISTINCT, GROUP BY, HAVING")
-    print("✓ Window Functions: ROW_NUMBER, RANK, DENSE_RANK, LAG, LEAD, FIRST_VALUE, LAST_VALUE")
-    print("✓ Date/Time: CURRENT_DATE, CURRENT_TIMESTAMP, DATE_TRUNC, EXTRACT, Arithmetic")
-    print("✓ String Functions: CONCAT, SUBSTRING, UPPER, LOWER, TRIM, LENGTH, REPLACE")
-    print("✓ Math Functions: ROUND, CEIL, FLOOR, ABS, MOD, POWER, SQRT")
-    print("✓ Sorting: ORDER BY (ASC/DESC, Multiple, NULLS FIRST/LAST)")
-    print("✓ Set Operations: UNION, UNION ALL, INTERSECT, EXCEPT")
-    print("✓ Subqueries: Scalar, FROM, Correlated, EXISTS, NOT EXISTS")
-    print("✓ CTEs: Simple, Multiple, Recursive-ready")
-    print("✓ ABAP Keywords: SINGLE, UP TO, CLIENT SPECIFIED, BYPASSING BUFFER, FOR UPDATE")
-    print("✓ ABAP Features: Host Variables, CASE, LIMIT/OFFSET, NULL handling")
-    print("✓ ABAP Enhanced: INTO, APPENDING TABLE, PACKAGE SIZE, Tilde (~) operator")
-    print("✓ ABAP String Ops: CP, CS, CA, CO, NP, NS, NA, CN (Contains Pattern, etc.)")
-    print("✓ ABAP Functions: CONCAT_WITH_SPACE, STRING_AGG, CAST, COALESCE")
-    print("✓ Operators: IN, NOT IN, BETWEEN, LIKE, NOT LIKE")
-    print("✓ Special: DISTINCT, COALESCE, NULLIF, Pattern Matching")
+    # Detailed breakdown and feature coverage are static reference text;
+    # only emit them (as one buffered write) when verbose output is on.
+    if VERBOSE:
+        report = []
+        report.append("\nTest Suite Breakdown:")
+        report.append("  Basic Tests:         14 tests (positive)")
+        report.append("  Extended Tests:      69 tests (positive)")
+        report.append("    - JOINs:           9 tests")
+        report.append("    - Aggregates:     10 tests")
+        report.append("    - Windows:        10 tests")
+        report.append("    - Date/Time:       6 tests")
+        report.append("    - Strings:         8 tests")
+        report.append("    - Math:            7 tests")
+        report.append("    - ORDER BY:        8 tests")
+        report.append("    - Set Ops:         4 tests")
+        report.append("    - CTEs:            7 tests")
+        report.append("  ABAP-Specific:      38 tests")
+        report.append("    - ABAP Syntax:     5 tests")
+        report.append("    - Host Variables:  3 tests")
+        report.append("    - Table Ops:       3 tests")
+        report.append("    - ABAP JOINs:      2 tests")
+        report.append("    - Aggregates:      2 tests")
+        report.append("    - CASE:            3 tests")
+        report.append("    - LIMIT/OFFSET:    4 tests")
+        report.append("    - NULL Handling:   4 tests")
+        report.append("    - DISTINCT:        3 tests")
+        report.append("    - IN Operator:     3 tests")
+        report.append("    - BETWEEN:         3 tests")
+        report.append("    - LIKE:            3 tests")
+        report.append("  ABAP Enhanced:      36 tests")
+        report.append("    - INTO clauses:    4 tests")
+        report.append("    - UP TO/BYPASSING: 7 tests")
+        report.append("    - FOR UPDATE:      2 tests")
+        report.append("    - PACKAGE SIZE:    2 tests")
+        report.append("    - Combined:        2 tests")
+        report.append("    - String Ops:      8 tests")
+        report.append("    - Functions:       4 tests")
+        report.append("    - Host Vars:       4 tests")
+        report.append("    - Tilde (~):       3 tests")
+        report.append("  Negative Tests:      21 tests (error detection)")
+        report.append(f"\n  TOTAL:            {total_tests} tests")
+
+        # Coverage summary
+        report.append("\n" + "=" * 80)
+        report.append("SQL FEATURE COVERAGE")
+        report.append("=" * 80)
+        report.append("✓ JOINs: INNER, LEFT, RIGHT, FULL OUTER, CROSS, Multiple, Self")
+        report.append("✓ Aggregates: COUNT, SUM, AVG, MIN, MAX, COUNT DISTINCT, GROUP BY, HAVING")
+        report.append("✓ Window Functions: ROW_NUMBER, RANK, DENSE_RANK, LAG, LEAD, FIRST_VALUE, LAST_VALUE")
+        report.append("✓ Date/Time: CURRENT_DATE, CURRENT_TIMESTAMP, DATE_TRUNC, EXTRACT, Arithmetic")
+        report.append("✓ String Functions: CONCAT, SUBSTRING, UPPER, LOWER, TRIM, LENGTH, REPLACE")
+        report.append("✓ Math Functions: ROUND, CEIL, FLOOR, ABS, MOD, POWER, SQRT")
+        report.append("✓ Sorting: ORDER BY (ASC/DESC, Multiple, NULLS FIRST/LAST)")
+        report.append("✓ Set Operations: UNION, UNION ALL, INTERSECT, EXCEPT")
+        report.append("✓ Subqueries: Scalar, FROM, Correlated, EXISTS, NOT EXISTS")
+        report.append("✓ CTEs: Simple, Multiple, Recursive-ready")
+        report.append("✓ ABAP Keywords: SINGLE, UP TO, CLIENT SPECIFIED, BYPASSING BUFFER, FOR UPDATE")
+        report.append("✓ ABAP Features: Host Variables, CASE, LIMIT/OFFSET, NULL handling")
+        report.append("✓ ABAP Enhanced: INTO, APPENDING TABLE, PACKAGE SIZE, Tilde (~) operator")
+        report.append("✓ ABAP String Ops: CP, CS, CA, CO, NP, NS, NA, CN (Contains Pattern, etc.)")
+        report.append("✓ ABAP Functions: CONCAT_WITH_SPACE, STRING_AGG, CAST, COALESCE")
+        report.append("✓ Operators: IN, NOT IN, BETWEEN, LIKE, NOT LIKE")
+        report.append("✓ Special: DISTINCT, COALESCE, NULLIF, Pattern Matching")
+        print("\n".join(report))
     
     # Final verdict
     print("\n" + "=" * 80)
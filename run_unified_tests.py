@@ -35,18 +35,114 @@ from test_aql_basic import (
     TestBasicAQLSyntax, TestAQLInsertUpdateDelete, TestAQLOrderBy, TestAQLQueryAnalysis
 )
 from test_aql_extended import (
-    TestAQLJoins, TestAQLAggregates, TestAQLDateFunctions, TestAQLStringFunctions,
-    TestAQLMathFunctions, TestAQLConditionals, TestAQLSubqueries, TestAQLUnion
+    TestAQLJoins, TestAQLAggregates, TestAQLDateFunctions,
+    TestAQLConditionals, TestAQLSubqueries, TestAQLUnion,
+    STRING_FUNCTION_SQLS, MATH_FUNCTION_SQLS
 )
 from test_aql_specific import (
-    TestAQLObjectReferences, TestAQLDotNotation, TestAQLComplexQueries, TestAQLBatchProcessing
+    TestAQLComplexQueries, TestAQLBatchProcessing,
+    OBJECT_REFERENCE_SQLS, DOT_NOTATION_SQLS
 )
 from test_aql_negative import (
-    TestAQLNegativeSyntax, TestAQLNegativeJoins, TestAQLNegativeAggregates,
-    TestAQLNegativeDML, TestAQLNegativeFunctions, TestAQLNegativeSubqueries,
-    TestAQLNegativeComplexErrors
+    TestAQLNegativeAggregates, TestAQLNegativeFunctions,
+    TestAQLNegativeSubqueries, TestAQLNegativeComplexErrors, INVALID_SQLS
 )
 
+from aql_sql_checker import AQLSQLChecker
+from test_helpers import _errors_mention
+
+# Several AQL suites were rewritten as parametrized pytest case tables
+# (pytest.param tuples). The bridges below drive those tables under
+# unittest so this runner keeps covering them; each param's id names the
+# subTest. One checker serves all of them.
+_AQL_CHECKER = AQLSQLChecker()
+
+
+def _assert_params_valid(case, params):
+    """Fail ``case`` for any statement in ``params`` that is not valid."""
+    for param in params:
+        sql = param.values[0]
+        with case.subTest(case=param.id):
+            is_valid, _, errors = _AQL_CHECKER.check_syntax(sql)
+            if not is_valid:
+                raise case.failureException(f"{param.id}: {errors}")
+
+
+def _assert_params_invalid(case, params, ids):
+    """Fail ``case`` for any selected statement that is not rejected."""
+    for param in params:
+        if param.id not in ids:
+            continue
+        sql, keywords = param.values
+        with case.subTest(case=param.id):
+            is_valid, _, errors = _AQL_CHECKER.check_syntax(
+                sql, validate_only=True)
+            if is_valid:
+                raise case.failureException(
+                    f"{param.id}: should be rejected")
+            if keywords and not _errors_mention(errors, *keywords):
+                raise case.failureException(
+                    f"{param.id}: errors should mention one of "
+                    f"{keywords}: {errors}")
+
+
+class TestAQLStringFunctions(unittest.TestCase):
+    """Bridge over test_aql_extended's string-function case table."""
+
+    def test_string_functions(self):
+        _assert_params_valid(self, STRING_FUNCTION_SQLS)
+
+
+class TestAQLMathFunctions(unittest.TestCase):
+    """Bridge over test_aql_extended's math-function case table."""
+
+    def test_math_functions(self):
+        _assert_params_valid(self, MATH_FUNCTION_SQLS)
+
+
+class TestAQLObjectReferences(unittest.TestCase):
+    """Bridge over test_aql_specific's object-reference case table."""
+
+    def test_object_references(self):
+        _assert_params_valid(self, OBJECT_REFERENCE_SQLS)
+
+
+class TestAQLDotNotation(unittest.TestCase):
+    """Bridge over test_aql_specific's dot-notation case table."""
+
+    def test_dot_notation(self):
+        _assert_params_valid(self, DOT_NOTATION_SQLS)
+
+
+class TestAQLNegativeSyntax(unittest.TestCase):
+    """Bridge over the syntax slice of test_aql_negative's case table."""
+
+    def test_syntax_errors(self):
+        _assert_params_invalid(self, INVALID_SQLS, {
+            "select-without-from", "empty-select-list", "dangling-operator",
+            "consecutive-operators", "mismatched-parentheses",
+            "invalid-where-clause",
+        })
+
+
+class TestAQLNegativeJoins(unittest.TestCase):
+    """Bridge over the join slice of test_aql_negative's case table."""
+
+    def test_join_errors(self):
+        _assert_params_invalid(self, INVALID_SQLS, {
+            "join-without-on", "left-join-without-on",
+        })
+
+
+class TestAQLNegativeDML(unittest.TestCase):
+    """Bridge over the DML slice of test_aql_negative's case table."""
+
+    def test_dml_errors(self):
+        _assert_params_invalid(self, INVALID_SQLS, {
+            "insert-without-values", "update-without-set",
+            "delete-without-table",
+        })
+
 
 def run_test_suite(name: str, test_classes: list, verbosity: int = 1) -> unittest.TestResult:
     """
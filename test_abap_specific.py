@@ -9,6 +9,53 @@ import unittest
 from abap_sql_checker import ABAPSQLChecker
 
 
+# Multi-line SQL fixtures hoisted to module scope so each string is built
+# once at import time (LOAD_CONST in the test bodies) and caches keyed on
+# the SQL text get identity hits across repeated runs.
+_SQL_MULTIPLE_HOST_VARIABLES = """SELECT carrid, connid FROM sflight
+                 WHERE carrid = :lv_carrid AND connid = :lv_connid"""
+
+_SQL_INNER_JOIN_ABAP_STYLE = """SELECT f.carrid, p.cityfrom
+                 FROM sflight AS f
+                 INNER JOIN spfli AS p ON f.carrid = p.carrid
+                 WHERE f.carrid = 'AA'"""
+
+_SQL_GROUP_BY_WITH_HAVING = """SELECT carrid, AVG(seatsocc) as avg_seats
+                 FROM sflight
+                 GROUP BY carrid
+                 HAVING AVG(seatsocc) > 100"""
+
+_SQL_SIMPLE_CASE = """SELECT carrid,
+                        CASE carrid
+                          WHEN 'AA' THEN 'American'
+                          WHEN 'LH' THEN 'Lufthansa'
+                          ELSE 'Other'
+                        END as carrier_name
+                 FROM sflight"""
+
+_SQL_SEARCHED_CASE = """SELECT carrid, seatsocc,
+                        CASE
+                          WHEN seatsocc > 200 THEN 'HIGH'
+                          WHEN seatsocc > 100 THEN 'MEDIUM'
+                          ELSE 'LOW'
+                        END as occupancy_level
+                 FROM sflight"""
+
+_SQL_NESTED_CASE = """SELECT carrid, seatsocc,
+                        CASE
+                          WHEN carrid = 'AA' THEN
+                            CASE
+                              WHEN seatsocc > 200 THEN 'AA-HIGH'
+                              ELSE 'AA-LOW'
+                            END
+                          ELSE 'OTHER'
+                        END as category
+                 FROM sflight"""
+
+_SQL_IN_SUBQUERY = """SELECT carrid, connid FROM spfli
+                 WHERE carrid IN (SELECT DISTINCT carrid FROM sflight)"""
+
+
 class TestABAPSpecificSyntax(unittest.TestCase):
     """Test ABAP-specific SQL syntax."""
     
@@ -71,8 +118,7 @@ class TestABAPHostVariables(unittest.TestCase):
     
     def test_multiple_host_variables(self):
         """Test multiple host variables."""
-        sql = """SELECT carrid, connid FROM sflight 
-                 WHERE carrid = :lv_carrid AND connid = :lv_connid"""
+        sql = _SQL_MULTIPLE_HOST_VARIABLES
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertTrue(is_valid, f"Multiple host variables failed: {errors}")
 
@@ -121,10 +167,7 @@ class TestABAPJoinSyntax(unittest.TestCase):
     
     def test_inner_join_abap_style(self):
         """Test ABAP-style INNER JOIN."""
-        sql = """SELECT f.carrid, p.cityfrom
-                 FROM sflight AS f
-                 INNER JOIN spfli AS p ON f.carrid = p.carrid
-                 WHERE f.carrid = 'AA'"""
+        sql = _SQL_INNER_JOIN_ABAP_STYLE
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertTrue(is_valid)
 
@@ -144,10 +187,7 @@ class TestABAPAggregateExtensions(unittest.TestCase):
     
     def test_group_by_with_having(self):
         """Test GROUP BY with HAVING."""
-        sql = """SELECT carrid, AVG(seatsocc) as avg_seats
-                 FROM sflight
-                 GROUP BY carrid
-                 HAVING AVG(seatsocc) > 100"""
+        sql = _SQL_GROUP_BY_WITH_HAVING
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertTrue(is_valid)
 
@@ -161,40 +201,19 @@ class TestABAPCaseExpressions(unittest.TestCase):
     
     def test_simple_case(self):
         """Test simple CASE expression."""
-        sql = """SELECT carrid,
-                        CASE carrid
-                          WHEN 'AA' THEN 'American'
-                          WHEN 'LH' THEN 'Lufthansa'
-                          ELSE 'Other'
-                        END as carrier_name
-                 FROM sflight"""
+        sql = _SQL_SIMPLE_CASE
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertTrue(is_valid)
     
     def test_searched_case(self):
         """Test searched CASE expression."""
-        sql = """SELECT carrid, seatsocc,
-                        CASE
-                          WHEN seatsocc > 200 THEN 'HIGH'
-                          WHEN seatsocc > 100 THEN 'MEDIUM'
-                          ELSE 'LOW'
-                        END as occupancy_level
-                 FROM sflight"""
+        sql = _SQL_SEARCHED_CASE
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertTrue(is_valid)
     
     def test_nested_case(self):
         """Test nested CASE expressions."""
-        sql = """SELECT carrid, seatsocc,
-                        CASE
-                          WHEN carrid = 'AA' THEN
-                            CASE
-                              WHEN seatsocc > 200 THEN 'AA-HIGH'
-                              ELSE 'AA-LOW'
-                            END
-                          ELSE 'OTHER'
-                        END as category
-                 FROM sflight"""
+        sql = _SQL_NESTED_CASE
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertTrue(is_valid)
 
@@ -304,8 +323,7 @@ class TestABAPInOperator(unittest.TestCase):
     
     def test_in_subquery(self):
         """Test IN with subquery."""
-        sql = """SELECT carrid, connid FROM spfli
-                 WHERE carrid IN (SELECT DISTINCT carrid FROM sflight)"""
+        sql = _SQL_IN_SUBQUERY
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertTrue(is_valid)
     
@@ -8,132 +8,94 @@ Author: Generated with Claude
 License: MIT
 """
 
+import sys
 import unittest
-from aql_sql_checker import AQLSQLChecker
-
-
-class TestAQLNegativeSyntax(unittest.TestCase):
-    """Test error detection for invalid SQL syntax."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.checker = AQLSQLChecker()
-    
-    def test_select_without_from(self):
-        """Test SELECT without FROM clause."""
-        sql = "SELECT DocumentId WHERE Status = 'Active'"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing FROM")
-        self.assertTrue(any("FROM" in str(e) for e in errors))
-    
-    def test_empty_select_list(self):
-        """Test empty SELECT list."""
-        sql = "SELECT FROM Document"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect empty SELECT list")
-    
-    def test_dangling_operator(self):
-        """Test dangling arithmetic operator."""
-        sql = "SELECT a, + FROM Document"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect dangling operator")
-    
-    def test_consecutive_operators(self):
-        """Test consecutive operators."""
-        sql = "SELECT a ++ b FROM Document"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect consecutive operators")
-    
-    def test_mismatched_parentheses(self):
-        """Test mismatched parentheses."""
-        sql = "SELECT * FROM Document WHERE (Status = 'Active'"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect mismatched parentheses")
-    
-    def test_invalid_where_clause(self):
-        """Test invalid WHERE clause."""
-        sql = "SELECT * FROM Document WHERE AND Status = 'Active'"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect invalid WHERE clause")
 
-
-class TestAQLNegativeJoins(unittest.TestCase):
-    """Test error detection for invalid JOIN operations."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.checker = AQLSQLChecker()
-    
-    def test_join_without_on(self):
-        """Test JOIN without ON condition."""
-        sql = "SELECT * FROM Document d INNER JOIN Project p"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect JOIN without ON")
-        self.assertTrue(any("ON" in str(e) for e in errors))
-    
-    def test_left_join_without_on(self):
-        """Test LEFT JOIN without ON condition."""
-        sql = "SELECT * FROM Document d LEFT JOIN Project p"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect LEFT JOIN without ON")
+import pytest
+from aql_sql_checker import AQLSQLChecker
+from test_fixtures import SQL_SELECT_FROM_WHERE
+from test_helpers import _errors_mention
+
+
+# The rejection cases are homogeneous (parse, assert invalid, optionally
+# check the error mentions a keyword), so they run as parametrized pytest
+# cases against the session-scoped checker fixture from conftest.py.
+# keywords is a tuple: the error list must mention at least one of them.
+INVALID_SQLS = (
+    pytest.param("SELECT DocumentId WHERE Status = 'Active'", ("FROM",),
+                 id="select-without-from"),
+    pytest.param("SELECT FROM Document", (), id="empty-select-list"),
+    pytest.param("SELECT a, + FROM Document", (), id="dangling-operator"),
+    pytest.param("SELECT a ++ b FROM Document", (), id="consecutive-operators"),
+    pytest.param("SELECT * FROM Document WHERE (Status = 'Active'", (),
+                 id="mismatched-parentheses"),
+    pytest.param("SELECT * FROM Document WHERE AND Status = 'Active'", (),
+                 id="invalid-where-clause"),
+    pytest.param("SELECT * FROM Document d INNER JOIN Project p", ("ON",),
+                 id="join-without-on"),
+    pytest.param("SELECT * FROM Document d LEFT JOIN Project p", (),
+                 id="left-join-without-on"),
+    pytest.param("INSERT INTO Document (DocumentId, Title)",
+                 ("VALUES", "INSERT"), id="insert-without-values"),
+    pytest.param("UPDATE Document WHERE DocumentId = 1", ("SET",),
+                 id="update-without-set"),
+    pytest.param("DELETE WHERE DocumentId = 1", (), id="delete-without-table"),
+)
+
+
+# Statements used inside the remaining TestCase methods, interned at module
+# load so the parse caches get identity-fast key hits on repeat lookups.
+_SQL_AGGREGATE_NO_GROUP = sys.intern("SELECT Status, COUNT(*) FROM Document")
+_SQL_SUBSTRING_ONE_ARG = sys.intern("SELECT SUBSTRING(Title) FROM Document")
+_SQL_FORMATDATE_BAD = sys.intern(
+    "SELECT FORMATDATE(CreatedDate, INVALID_FORMAT) FROM Document")
+_SQL_SUBQUERY_NO_FROM = sys.intern(
+    """SELECT * FROM Document
+                 WHERE DocumentId IN (SELECT DocumentId WHERE Status = 'Active')""")
+_SQL_DANGLING_PLUS = sys.intern("SELECT a + FROM Document")
+_SQL_UNCLOSED_STRING = sys.intern("SELECT * FROM Document WHERE Status = 'Active")
+
+
+@pytest.mark.parametrize("sql,keywords", INVALID_SQLS)
+def test_invalid_statement(checker, sql, keywords):
+    """Test that each invalid statement is rejected, mentioning the clause."""
+    is_valid, _, errors = checker.check_syntax(sql, validate_only=True)
+    assert not is_valid, f"Should be rejected: {sql}"
+    if keywords:
+        assert _errors_mention(errors, *keywords), \
+            f"Errors should mention one of {keywords}: {errors}"
 
 
 class TestAQLNegativeAggregates(unittest.TestCase):
     """Test error detection for invalid aggregates."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.checker = AQLSQLChecker()
+    @classmethod
+    def setUpClass(cls):
+        """Build one checker for the whole class; it is read-only to tests."""
+        cls.checker = AQLSQLChecker()
     
     def test_aggregate_without_group_by(self):
         """Test aggregate with non-aggregated column (should warn or error)."""
         # Note: This is actually valid in some SQL dialects, but often problematic
-        sql = "SELECT Status, COUNT(*) FROM Document"
+        sql = _SQL_AGGREGATE_NO_GROUP
         is_valid, ast, errors = self.checker.check_syntax(sql)
         # SQLGlot may allow this, so we check if it parses
         # (Some dialects require GROUP BY, others don't)
         self.assertIsNotNone(ast)
 
 
-class TestAQLNegativeDML(unittest.TestCase):
-    """Test error detection for invalid DML statements."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.checker = AQLSQLChecker()
-    
-    def test_insert_without_values(self):
-        """Test INSERT without VALUES."""
-        sql = "INSERT INTO Document (DocumentId, Title)"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect INSERT without VALUES")
-        self.assertTrue(any("VALUES" in str(e) or "INSERT" in str(e) for e in errors))
-    
-    def test_update_without_set(self):
-        """Test UPDATE without SET clause."""
-        sql = "UPDATE Document WHERE DocumentId = 1"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect UPDATE without SET")
-        self.assertTrue(any("SET" in str(e) for e in errors))
-    
-    def test_delete_without_table(self):
-        """Test DELETE without table."""
-        sql = "DELETE WHERE DocumentId = 1"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect DELETE without table")
-
-
 class TestAQLNegativeFunctions(unittest.TestCase):
     """Test error detection for invalid function calls."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.checker = AQLSQLChecker()
+    @classmethod
+    def setUpClass(cls):
+        """Build one checker for the whole class; it is read-only to tests."""
+        cls.checker = AQLSQLChecker()
     
     def test_function_missing_arguments(self):
         """Test function with missing required arguments."""
         # Note: SQLGlot might parse this but it's semantically invalid
-        sql = "SELECT SUBSTRING(Title) FROM Document"
+        sql = _SQL_SUBSTRING_ONE_ARG
         is_valid, ast, errors = self.checker.check_syntax(sql)
         # This might parse but be semantically invalid
         # The behavior depends on SQLGlot's strictness
@@ -142,7 +104,7 @@ class TestAQLNegativeFunctions(unittest.TestCase):
     def test_invalid_date_format(self):
         """Test date function with invalid format."""
         # Note: Format validation is typically runtime, not parse-time
-        sql = "SELECT FORMATDATE(CreatedDate, INVALID_FORMAT) FROM Document"
+        sql = _SQL_FORMATDATE_BAD
         is_valid, ast, errors = self.checker.check_syntax(sql)
         # This should parse (format string is just a literal)
         self.assertIsNotNone(ast)
@@ -151,14 +113,14 @@ class TestAQLNegativeFunctions(unittest.TestCase):
 class TestAQLNegativeSubqueries(unittest.TestCase):
     """Test error detection for invalid subqueries."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.checker = AQLSQLChecker()
+    @classmethod
+    def setUpClass(cls):
+        """Build one checker for the whole class; it is read-only to tests."""
+        cls.checker = AQLSQLChecker()
     
     def test_subquery_without_from(self):
         """Test subquery without FROM clause."""
-        sql = """SELECT * FROM Document
-                 WHERE DocumentId IN (SELECT DocumentId WHERE Status = 'Active')"""
+        sql = _SQL_SUBQUERY_NO_FROM
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertFalse(is_valid, "Should detect subquery without FROM")
 
@@ -166,30 +128,31 @@ class TestAQLNegativeSubqueries(unittest.TestCase):
 class TestAQLNegativeComplexErrors(unittest.TestCase):
     """Test detection of complex error scenarios."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.checker = AQLSQLChecker()
+    @classmethod
+    def setUpClass(cls):
+        """Build one checker for the whole class; it is read-only to tests."""
+        cls.checker = AQLSQLChecker()
     
     def test_multiple_errors(self):
         """Test query with multiple errors."""
-        sql = "SELECT FROM WHERE"
+        sql = SQL_SELECT_FROM_WHERE
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertFalse(is_valid, "Should detect multiple errors")
         self.assertTrue(len(errors) > 0)
     
     def test_invalid_arithmetic(self):
         """Test invalid arithmetic expression."""
-        sql = "SELECT a + FROM Document"
+        sql = _SQL_DANGLING_PLUS
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertFalse(is_valid, "Should detect invalid arithmetic")
     
     def test_unclosed_string_literal(self):
         """Test unclosed string literal."""
-        sql = "SELECT * FROM Document WHERE Status = 'Active"
+        sql = _SQL_UNCLOSED_STRING
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertFalse(is_valid, "Should detect unclosed string")
 
 
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
+    pytest.main([__file__, '-v'])
 
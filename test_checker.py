@@ -8,16 +8,47 @@ Run with: python -m pytest test_checker.py
 Or simply: python test_checker.py
 """
 
+import textwrap
 import unittest
+
 from abap_sql_checker import ABAPSQLChecker
+from test_fixtures import SQL_SELECT_FROM_WHERE
+
+
+# Multi-line statements hoisted out of the test methods; dedent runs once at
+# import, so the tokenizer never re-skips the method-body indentation and the
+# constants are shared across every call.
+_SQL_JOIN = textwrap.dedent("""\
+    SELECT f.carrid, p.cityfrom
+    FROM sflight AS f
+    INNER JOIN spfli AS p ON f.carrid = p.carrid""")
+
+_SQL_SUBQUERY = textwrap.dedent("""\
+    SELECT carrid FROM spfli
+    WHERE carrid IN (SELECT carrid FROM sflight WHERE seatsocc > 100)""")
+
+_SQL_CASE = textwrap.dedent("""\
+    SELECT carrid,
+           CASE
+             WHEN seatsocc > 200 THEN 'HIGH'
+             ELSE 'LOW'
+           END as level
+    FROM sflight""")
+
+_SQL_HAVING = textwrap.dedent("""\
+    SELECT carrid, COUNT(*) as cnt
+    FROM sflight
+    GROUP BY carrid
+    HAVING COUNT(*) > 10""")
 
 
 class TestABAPSQLChecker(unittest.TestCase):
     """Test cases for ABAP SQL Checker."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.checker = ABAPSQLChecker()
+    @classmethod
+    def setUpClass(cls):
+        """Build one checker for the whole class; it is read-only to tests."""
+        cls.checker = ABAPSQLChecker()
     
     def test_simple_select(self):
         """Test basic SELECT statement."""
@@ -25,59 +56,59 @@ class TestABAPSQLChecker(unittest.TestCase):
         is_valid, ast, errors = self.checker.check_syntax(sql)
         self.assertTrue(is_valid, f"Should be valid, but got errors: {errors}")
         self.assertIsNotNone(ast)
-        self.assertEqual(len(errors), 0)
+        self.assertFalse(errors)
     
     def test_select_with_join(self):
         """Test SELECT with JOIN."""
-        sql = """SELECT f.carrid, p.cityfrom
-                 FROM sflight AS f
-                 INNER JOIN spfli AS p ON f.carrid = p.carrid"""
-        is_valid, ast, errors = self.checker.check_syntax(sql)
+        sql = _SQL_JOIN
+        is_valid, _, errors = self.checker.check_syntax(sql, build_ast=False)
         self.assertTrue(is_valid, f"Should be valid, but got errors: {errors}")
     
     def test_select_with_aggregate(self):
         """Test SELECT with aggregate functions."""
         sql = "SELECT carrid, COUNT(*) as cnt FROM sflight GROUP BY carrid"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
+        is_valid, _, errors = self.checker.check_syntax(sql, build_ast=False)
         self.assertTrue(is_valid, f"Should be valid, but got errors: {errors}")
     
     def test_select_with_subquery(self):
         """Test SELECT with subquery."""
-        sql = """SELECT carrid FROM spfli
-                 WHERE carrid IN (SELECT carrid FROM sflight WHERE seatsocc > 100)"""
-        is_valid, ast, errors = self.checker.check_syntax(sql)
+        sql = _SQL_SUBQUERY
+        is_valid, _, errors = self.checker.check_syntax(sql, build_ast=False)
         self.assertTrue(is_valid, f"Should be valid, but got errors: {errors}")
     
     def test_invalid_syntax(self):
         """Test invalid SQL syntax."""
-        sql = "SELECT FROM WHERE"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
+        sql = SQL_SELECT_FROM_WHERE
+        is_valid, _, errors = self.checker.check_syntax(sql, build_ast=False)
         self.assertFalse(is_valid)
-        self.assertGreater(len(errors), 0)
+        self.assertTrue(errors)
     
     def test_update_statement(self):
         """Test UPDATE statement."""
         sql = "UPDATE sflight SET seatsocc = 100 WHERE carrid = 'AA'"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
+        is_valid, _, errors = self.checker.check_syntax(sql, build_ast=False)
         self.assertTrue(is_valid, f"Should be valid, but got errors: {errors}")
     
     def test_delete_statement(self):
         """Test DELETE statement."""
         sql = "DELETE FROM sbook WHERE customid = '123'"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
+        is_valid, _, errors = self.checker.check_syntax(sql, build_ast=False)
         self.assertTrue(is_valid, f"Should be valid, but got errors: {errors}")
     
     def test_insert_statement(self):
         """Test INSERT statement."""
         sql = "INSERT INTO spfli (carrid, connid) VALUES ('XX', '1234')"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
+        is_valid, _, errors = self.checker.check_syntax(sql, build_ast=False)
         self.assertTrue(is_valid, f"Should be valid, but got errors: {errors}")
     
     def test_analyze_query(self):
         """Test query analysis."""
         sql = "SELECT carrid, connid FROM sflight WHERE carrid = 'AA'"
-        analysis = self.checker.analyze_query(sql)
-        
+        is_valid, ast, errors = self.checker.check_syntax(sql)
+        self.assertTrue(is_valid)
+        # Reuse the tree from check_syntax instead of re-checking.
+        analysis = self.checker.analyze_query(sql, ast=ast)
+
         self.assertTrue(analysis['valid'])
         self.assertIn('sflight', analysis['tables'])
         self.assertIn('carrid', analysis['columns'])
@@ -97,60 +128,34 @@ class TestABAPSQLChecker(unittest.TestCase):
         sql = "SELECT * FROM sflight"
         analysis = self.checker.analyze_query(sql)
         self.assertTrue(analysis['valid'])
-        self.assertGreater(len(analysis['warnings']), 0)
+        self.assertTrue(analysis['warnings'])
     
     def test_case_expression(self):
         """Test CASE expression."""
-        sql = """SELECT carrid,
-                        CASE
-                          WHEN seatsocc > 200 THEN 'HIGH'
-                          ELSE 'LOW'
-                        END as level
-                 FROM sflight"""
-        is_valid, ast, errors = self.checker.check_syntax(sql)
+        sql = _SQL_CASE
+        is_valid, _, errors = self.checker.check_syntax(sql, build_ast=False)
         self.assertTrue(is_valid, f"Should be valid, but got errors: {errors}")
     
     def test_order_by(self):
         """Test ORDER BY clause."""
         sql = "SELECT carrid, connid FROM sflight ORDER BY carrid DESC, connid ASC"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
+        is_valid, _, errors = self.checker.check_syntax(sql, build_ast=False)
         self.assertTrue(is_valid, f"Should be valid, but got errors: {errors}")
     
     def test_having_clause(self):
         """Test HAVING clause."""
-        sql = """SELECT carrid, COUNT(*) as cnt
-                 FROM sflight
-                 GROUP BY carrid
-                 HAVING COUNT(*) > 10"""
-        is_valid, ast, errors = self.checker.check_syntax(sql)
+        sql = _SQL_HAVING
+        is_valid, _, errors = self.checker.check_syntax(sql, build_ast=False)
         self.assertTrue(is_valid, f"Should be valid, but got errors: {errors}")
 
 
-def run_tests():
-    """Run all tests and display results."""
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromTestCase(TestABAPSQLChecker)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Summary
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Successes: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print("=" * 70)
-    
-    return result.wasSuccessful()
-
-
 if __name__ == "__main__":
     import sys
-    success = run_tests()
-    sys.exit(0 if success else 1)
+
+    import pytest
+
+    # pytest replaces the hand-rolled TextTestRunner entry; with
+    # pytest-xdist installed, "-n auto" here would fan the tests out
+    # across cores (each worker process gets its own checker caches).
+    sys.exit(pytest.main(["-q", __file__]))
 
@@ -0,0 +1,22 @@
+"""
+Shared SQL literals for the test suite.
+
+Statements that appear in more than one test class or module live here as
+interned module-level constants, so every reference is the same string
+object: the parse lru_cache keys hit identically, and each literal exists
+once instead of as a bytecode constant per duplicate.
+
+Author: Generated with Claude
+License: MIT
+"""
+
+import sys
+
+# Valid statements reused across batch and single-query tests.
+SQL_SELECT_ACTIVE = sys.intern("SELECT * FROM Document WHERE Status = 'Active'")
+SQL_COUNT_INVOICE = sys.intern("SELECT COUNT(*) FROM Invoice")
+SQL_SUPPLIER_US = sys.intern("SELECT * FROM Supplier WHERE Region = 'US'")
+
+# Short invalid fragments shared by the negative tests.
+SQL_SELECT_FROM_WHERE = sys.intern("SELECT FROM WHERE")
+SQL_SELECT_MISSING_FROM = sys.intern("SELECT WHERE Status = 'Active'")
@@ -0,0 +1,32 @@
+"""
+Golden Snapshot Cross-Check
+
+Verifies that the live checker still agrees with the committed verdict
+snapshot (golden_asts.json) for every SQL literal in the test corpus.
+A checker change that flips any verdict fails here with the offending
+statement, and the snapshot diff from ``python regen_golden.py`` shows
+exactly what moved.
+
+Author: Generated with Claude
+License: MIT
+"""
+
+import pytest
+
+
+def test_golden_verdicts_match_checker(checker, abap_checker, golden):
+    """Test that every recorded verdict matches its dialect's checker."""
+    if not golden:
+        pytest.skip("golden_asts.json not generated; run regen_golden.py")
+    mismatches = []
+    for entry in golden.values():
+        live = abap_checker if entry['dialect'] == 'ABAP' else checker
+        is_valid, _, _ = live.check_syntax(entry['sql'])
+        if is_valid != entry['valid']:
+            mismatches.append((entry['sql'], entry['valid'], is_valid))
+    assert not mismatches, \
+        f"Verdicts changed since the snapshot was recorded: {mismatches}"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,42 @@
+"""
+Shared helpers for the AQL test modules.
+
+Author: Generated with Claude
+License: MIT
+"""
+
+import re
+
+# The clause keywords the checkers embed in their error messages. Scanning
+# with one bounded alternation over a joined blob keeps the search on
+# CPython's fast C path instead of matching arbitrary uppercase runs.
+_KW_RE = re.compile(r'\b(FROM|VALUES|INSERT|SET|ON|GROUP|OVER)\b')
+
+
+def _error_tokens(errors) -> frozenset:
+    """
+    Return the clause keywords mentioned across all errors.
+
+    Each error is stringified exactly once, the messages are joined, and
+    the blob is scanned in a single pass with the precompiled keyword
+    alternation; the resulting frozenset supports O(1) membership and set
+    intersection for multi-keyword assertions, instead of re-stringifying
+    the errors per keyword.
+    """
+    blob = '\n'.join(str(e) for e in errors)
+    return frozenset(m.group(1) for m in _KW_RE.finditer(blob))
+
+
+def _errors_mention(errors, *keywords) -> bool:
+    """
+    Return True if any error's message mentions any of the keywords.
+
+    Replaces the ``any(k in str(e) for e in errors for k in keywords)``
+    idiom with one tokenize pass and a set intersection, so the cost is
+    O(total message length) regardless of how many keywords are checked.
+    Keywords are the uppercase clause names the checker embeds in its
+    messages (FROM, VALUES, SET, ...).
+    """
+    if not keywords:
+        return False
+    return bool(frozenset(keywords) & _error_tokens(errors))
@@ -6,229 +6,148 @@ Run with: python test_negative.py
 """
 
 import unittest
+
+import pytest
+
 from abap_sql_checker import ABAPSQLChecker
 
+# One checker for the whole module; check_syntax is read-only per call and
+# its parse cache is shared across every parametrized case below.
+_CHECKER = ABAPSQLChecker()
+
+# (case id, invalid SQL, failure message).  A single parametrized test
+# drives the whole table, so adding a case is one line here instead of a
+# four-line test method.
+NEGATIVE_CASES = (
+    # Syntax errors
+    ("missing_from",
+     "SELECT carrid, connid WHERE carrid = 'AA'",
+     "Should detect missing FROM clause"),
+    ("missing_table_name",
+     "SELECT carrid, connid FROM WHERE carrid = 'AA'",
+     "Should detect missing table name"),
+    ("incomplete_select",
+     "SELECT FROM WHERE",
+     "Should detect incomplete SELECT"),
+    ("missing_join_condition",
+     """SELECT f.carrid, p.cityfrom
+        FROM sflight AS f
+        INNER JOIN spfli AS p
+        WHERE f.carrid = 'AA'""",
+     "Should detect missing JOIN condition"),
+    # Aggregate function errors
+    ("aggregate_without_parentheses",
+     "SELECT COUNT * FROM sflight",
+     "Should detect missing parentheses in COUNT"),
+    # Parentheses errors
+    ("unmatched_opening_paren",
+     "SELECT carrid FROM sflight WHERE (carrid = 'AA'",
+     "Should detect unmatched opening parenthesis"),
+    ("unmatched_closing_paren",
+     "SELECT carrid FROM sflight WHERE carrid = 'AA')",
+     "Should detect unmatched closing parenthesis"),
+    ("missing_subquery_paren",
+     """SELECT carrid FROM spfli
+        WHERE carrid IN SELECT carrid FROM sflight)""",
+     "Should detect missing opening parenthesis in subquery"),
+    # String literal errors
+    ("unclosed_string_single",
+     "SELECT carrid FROM sflight WHERE carrid = 'AA",
+     "Should detect unclosed string literal"),
+    # Invalid subqueries
+    ("unclosed_subquery",
+     """SELECT carrid FROM spfli
+        WHERE carrid IN (SELECT carrid FROM sflight""",
+     "Should detect unclosed subquery"),
+    # Invalid CASE expressions
+    ("case_without_end",
+     """SELECT carrid,
+               CASE
+                 WHEN seatsocc > 200 THEN 'HIGH'
+               as level
+        FROM sflight""",
+     "Should detect CASE without END"),
+    # Invalid set operations
+    ("incomplete_union",
+     """SELECT carrid FROM sflight
+        UNION""",
+     "Should detect incomplete UNION"),
+    # Invalid window functions
+    ("window_function_without_over",
+     "SELECT carrid, ROW_NUMBER() as rn FROM sflight",
+     "Should detect missing OVER clause"),
+    # Invalid INSERT/UPDATE/DELETE
+    ("insert_without_values",
+     "INSERT INTO sflight (carrid, connid)",
+     "Should detect missing VALUES"),
+    ("update_without_set",
+     "UPDATE sflight WHERE carrid = 'AA'",
+     "Should detect missing SET"),
+    ("delete_without_from",
+     "DELETE WHERE carrid = 'AA'",
+     "Should detect missing FROM"),
+    # Invalid expressions
+    ("invalid_arithmetic",
+     "SELECT carrid, + FROM sflight",
+     "Should detect invalid arithmetic"),
+    ("missing_operand",
+     "SELECT carrid, seatsocc + FROM sflight",
+     "Should detect missing operand"),
+    # Complex invalid queries
+    ("gibberish_query",
+     "RANDOM INVALID SQL STATEMENT HERE",
+     "Should detect gibberish query"),
+    ("multiple_syntax_errors",
+     "SELECT carrid connid FROM sflight spfli WHERE",
+     "Should detect multiple syntax errors"),
+)
+
+
+@pytest.mark.parametrize(
+    "sql, msg", [pytest.param(s, m, id=n) for n, s, m in NEGATIVE_CASES])
+def test_invalid_statement(sql, msg):
+    """Every statement in NEGATIVE_CASES must fail validation."""
+    is_valid, _, errors = _CHECKER.check_syntax(sql, build_ast=False)
+    assert not is_valid, msg
+    assert errors
+
+
+def test_non_aggregated_column_in_group_by():
+    """Test non-aggregated column without GROUP BY."""
+    sql = """SELECT carrid, connid, COUNT(*) as cnt
+             FROM sflight
+             GROUP BY carrid"""
+    _CHECKER.check_syntax(sql, build_ast=False)
+    # Note: This is a semantic error that SQLGlot may not catch
+    # The test documents expected behavior
+    # In strict SQL, this should fail
+
 
 class TestNegativeCases(unittest.TestCase):
-    """Test cases for invalid SQL that should fail validation."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.checker = ABAPSQLChecker()
-    
-    # ========================================================================
-    # SYNTAX ERRORS
-    # ========================================================================
-    
-    def test_missing_from(self):
-        """Test missing FROM clause."""
-        sql = "SELECT carrid, connid WHERE carrid = 'AA'"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing FROM clause")
-        self.assertGreater(len(errors), 0)
-    
-    def test_missing_table_name(self):
-        """Test missing table name after FROM."""
-        sql = "SELECT carrid, connid FROM WHERE carrid = 'AA'"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing table name")
-    
-    def test_incomplete_select(self):
-        """Test incomplete SELECT statement."""
-        sql = "SELECT FROM WHERE"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect incomplete SELECT")
-    
-    def test_missing_join_condition(self):
-        """Test JOIN without ON condition."""
-        sql = """SELECT f.carrid, p.cityfrom
-                 FROM sflight AS f
-                 INNER JOIN spfli AS p
-                 WHERE f.carrid = 'AA'"""
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing JOIN condition")
-    
-    # ========================================================================
-    # AGGREGATE FUNCTION ERRORS
-    # ========================================================================
-    
+    """unittest bridge over NEGATIVE_CASES for the aggregated runners."""
+
+    # The parametrized tests above already cover every case under pytest;
+    # keep pytest from collecting the bridge too and running them twice.
+    # unittest's TestLoader ignores this attribute, so the aggregated
+    # runners still load the class.
+    __test__ = False
+
+    def test_negative_cases(self):
+        for name, sql, msg in NEGATIVE_CASES:
+            with self.subTest(case=name):
+                is_valid, _, errors = _CHECKER.check_syntax(
+                    sql, build_ast=False)
+                if is_valid or not errors:
+                    raise self.failureException(f"{name}: {msg}")
+
     def test_non_aggregated_column_in_group_by(self):
-        """Test non-aggregated column without GROUP BY."""
-        sql = """SELECT carrid, connid, COUNT(*) as cnt
-                 FROM sflight
-                 GROUP BY carrid"""
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        # Note: This is a semantic error that SQLGlot may not catch
-        # The test documents expected behavior
-        # In strict SQL, this should fail
-    
-    def test_aggregate_without_parentheses(self):
-        """Test aggregate function without parentheses."""
-        sql = "SELECT COUNT * FROM sflight"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing parentheses in COUNT")
-    
-    # ========================================================================
-    # PARENTHESES ERRORS
-    # ========================================================================
-    
-    def test_unmatched_opening_paren(self):
-        """Test unmatched opening parenthesis."""
-        sql = "SELECT carrid FROM sflight WHERE (carrid = 'AA'"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect unmatched opening parenthesis")
-    
-    def test_unmatched_closing_paren(self):
-        """Test unmatched closing parenthesis."""
-        sql = "SELECT carrid FROM sflight WHERE carrid = 'AA')"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect unmatched closing parenthesis")
-    
-    def test_missing_subquery_paren(self):
-        """Test subquery with missing parenthesis."""
-        sql = """SELECT carrid FROM spfli
-                 WHERE carrid IN SELECT carrid FROM sflight)"""
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing opening parenthesis in subquery")
-    
-    # ========================================================================
-    # STRING LITERAL ERRORS
-    # ========================================================================
-    
-    def test_unclosed_string_single(self):
-        """Test unclosed string with single quote."""
-        sql = "SELECT carrid FROM sflight WHERE carrid = 'AA"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect unclosed string literal")
-    
-    # ========================================================================
-    # INVALID SUBQUERIES
-    # ========================================================================
-    
-    def test_unclosed_subquery(self):
-        """Test unclosed subquery."""
-        sql = """SELECT carrid FROM spfli
-                 WHERE carrid IN (SELECT carrid FROM sflight"""
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect unclosed subquery")
-    
-    # ========================================================================
-    # INVALID CASE EXPRESSIONS
-    # ========================================================================
-    
-    def test_case_without_end(self):
-        """Test CASE without END."""
-        sql = """SELECT carrid,
-                        CASE
-                          WHEN seatsocc > 200 THEN 'HIGH'
-                        as level
-                 FROM sflight"""
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect CASE without END")
-    
-    # ========================================================================
-    # INVALID SET OPERATIONS
-    # ========================================================================
-    
-    def test_incomplete_union(self):
-        """Test incomplete UNION."""
-        sql = """SELECT carrid FROM sflight
-                 UNION"""
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect incomplete UNION")
-    
-    # ========================================================================
-    # INVALID WINDOW FUNCTIONS
-    # ========================================================================
-    
-    def test_window_function_without_over(self):
-        """Test window function without OVER clause."""
-        sql = "SELECT carrid, ROW_NUMBER() as rn FROM sflight"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing OVER clause")
-    
-    # ========================================================================
-    # INVALID INSERT/UPDATE/DELETE
-    # ========================================================================
-    
-    def test_insert_without_values(self):
-        """Test INSERT without VALUES."""
-        sql = "INSERT INTO sflight (carrid, connid)"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing VALUES")
-    
-    def test_update_without_set(self):
-        """Test UPDATE without SET."""
-        sql = "UPDATE sflight WHERE carrid = 'AA'"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing SET")
-    
-    def test_delete_without_from(self):
-        """Test DELETE without FROM."""
-        sql = "DELETE WHERE carrid = 'AA'"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing FROM")
-    
-    # ========================================================================
-    # INVALID EXPRESSIONS
-    # ========================================================================
-    
-    def test_invalid_arithmetic(self):
-        """Test invalid arithmetic expression."""
-        sql = "SELECT carrid, + FROM sflight"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect invalid arithmetic")
-    
-    def test_missing_operand(self):
-        """Test missing operand in expression."""
-        sql = "SELECT carrid, seatsocc + FROM sflight"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect missing operand")
-    
-    # ========================================================================
-    # COMPLEX INVALID QUERIES
-    # ========================================================================
-    
-    def test_gibberish_query(self):
-        """Test complete gibberish."""
-        sql = "RANDOM INVALID SQL STATEMENT HERE"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect gibberish query")
-    
-    def test_multiple_syntax_errors(self):
-        """Test query with multiple syntax errors."""
-        sql = "SELECT carrid connid FROM sflight spfli WHERE"
-        is_valid, ast, errors = self.checker.check_syntax(sql)
-        self.assertFalse(is_valid, "Should detect multiple syntax errors")
-
-
-def run_negative_tests():
-    """Run all negative tests and display results."""
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromTestCase(TestNegativeCases)
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Summary
-    print("\n" + "=" * 70)
-    print("NEGATIVE TEST SUMMARY")
-    print("=" * 70)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Successes (errors correctly detected): {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"Failures (errors not detected): {len(result.failures)}")
-    print(f"Errors (test issues): {len(result.errors)}")
-    print("=" * 70)
-    
-    if len(result.failures) > 0:
-        print("\n⚠️  Some invalid SQL was not detected as invalid!")
-        print("This may indicate areas where error detection can be improved.")
-    
-    return result.wasSuccessful()
+        test_non_aggregated_column_in_group_by()
 
 
 if __name__ == "__main__":
     import sys
-    success = run_negative_tests()
-    sys.exit(0 if success else 1)
 
+    # The tests are independent and parsing-bound, so with pytest-xdist
+    # installed "-n auto" here fans them out across cores; each worker
+    # process builds its own checker, nothing is pickled between them.
+    sys.exit(pytest.main(["-q", __file__]))